@@ -1,21 +1,40 @@
 import streamlit as st
 from typing import List, Dict
-import re
 import os
 from dotenv import load_dotenv
 import pinecone
 from pinecone import Pinecone, ServerlessSpec
-import json
+import orjson
 from openai import OpenAI  # Updated import for OpenAI v1.0+
 import threading
 import concurrent.futures
-from queue import Queue
+from collections import deque
+import numpy as np
+import pickle
+import atexit
+import httpx
+import tiktoken
 
 # Load environment variables
 load_dotenv()
 
-# Initialize OpenAI client (updated for v1.0+)
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Initialize OpenAI client (updated for v1.0+) with a pooled keep-alive HTTP
+# client so concurrent requests reuse connections instead of re-handshaking.
+# Built behind cache_resource: constructing it at module level would leak a
+# fresh socket pool on every Streamlit rerun.
+@st.cache_resource
+def _get_openai_client() -> OpenAI:
+    """Construct the pooled OpenAI client once and share it across reruns"""
+    return OpenAI(
+        api_key=os.getenv("OPENAI_API_KEY"),
+        http_client=httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=300),
+            timeout=30.0
+        )
+    )
+
+client = _get_openai_client()
 
 # Initialize Pinecone
 pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
@@ -24,137 +43,340 @@ pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
 primary_index_name = os.getenv("PINECONE_INDEX_NAME", "mca-scraped-final1")
 trademark_index_name = os.getenv("TRADEMARK_INDEX_NAME", "tm-prod-pipeline")
 
-# Initialize indexes as None initially
-primary_index = None
-trademark_index = None
 
-# Lock for thread-safe operations
-pinecone_lock = threading.Lock()
+# Shared worker pool: created once per process so requests don't pay thread
+# startup cost, and so all OpenAI/Pinecone calls reuse warm connections.
+# cache_resource keeps it to one pool; a module-level pool would spawn 32
+# fresh non-daemon workers on every rerun and never shut the old ones down.
+@st.cache_resource
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Construct the shared worker pool once and reuse it across reruns"""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=32)
 
-def verify_indexes():
-    """Verify both indexes are accessible and return connection status"""
-    global primary_index, trademark_index
-    
-    # Define a function to connect to an index in a separate thread
+_EXECUTOR = _get_executor()
+
+# Dummy query vector built once at import; the lookups are metadata-filtered,
+# so rebuilding 1536 floats per call is pure serialization overhead
+_ZERO_VEC = [0.0] * 1536
+
+# Semantic response cache: avoids the OpenAI round-trip for near-duplicate descriptions.
+# Each entry is (normalized embedding, suggestion list); most recently used entries sit
+# at the right end of the deque so eviction drops the least recently used entry.
+_SEM_CACHE_MAX_ENTRIES = 512
+_SEM_CACHE_THRESHOLD = 0.92
+_SEM_CACHE_PATH = os.getenv("SEM_CACHE_PATH", ".sem_cache.pkl")
+
+# Unit-norm vectors quantized to int8 carry cos * 127^2 in their dot product,
+# so the similarity threshold scales the same way
+_SEM_CACHE_THRESHOLD_Q = int(_SEM_CACHE_THRESHOLD * 127 * 127)
+
+def _quantize_embedding(embedding: np.ndarray) -> np.ndarray:
+    """Quantize a unit-norm embedding to int8: 4x less memory per entry, and
+    the rounding error is negligible at the 0.92 similarity threshold."""
+    return np.round(embedding * 127.0).astype(np.int8)
+
+def _cache_embed(text: str) -> np.ndarray:
+    """Embed text for the semantic cache and normalize to unit length."""
+    response = client.embeddings.create(
+        model="text-embedding-3-small",
+        input=text
+    )
+    embedding = np.array(response.data[0].embedding, dtype=np.float32)
+    norm = np.linalg.norm(embedding)
+    if norm > 0:
+        embedding /= norm
+    return embedding
+
+def _sem_cache_save(cache: deque, lock: threading.Lock):
+    """Persist the semantic cache to disk so warm restarts skip OpenAI calls."""
+    try:
+        with lock:
+            with open(_SEM_CACHE_PATH, "wb") as f:
+                pickle.dump(list(cache), f)
+    except Exception:
+        # Persistence is best-effort; never block shutdown on it
+        pass
+
+def _sem_cache_load(cache: deque):
+    """Reload a previously persisted semantic cache, if one exists."""
+    try:
+        with open(_SEM_CACHE_PATH, "rb") as f:
+            entries = pickle.load(f)
+        for vector, suggestions in entries:
+            # Re-quantize entries persisted before the int8 format
+            if vector.dtype != np.int8:
+                vector = _quantize_embedding(vector)
+            cache.append((vector, suggestions))
+    except Exception:
+        # Missing or corrupt cache file just means a cold start
+        pass
+
+@st.cache_resource
+def _get_sem_cache():
+    """Build the semantic cache once per process. Streamlit re-executes this
+    script on every interaction, so module-level state would start empty on
+    each rerun; cache_resource keeps one deque (and one atexit save hook)
+    alive for the life of the server."""
+    cache = deque(maxlen=_SEM_CACHE_MAX_ENTRIES)
+    lock = threading.Lock()
+    _sem_cache_load(cache)
+    atexit.register(_sem_cache_save, cache, lock)
+    return cache, lock
+
+def _sem_cache_lookup(embedding: np.ndarray):
+    """Return the cached suggestion list for the most similar stored description,
+    or None if nothing is above the similarity threshold."""
+    query = _quantize_embedding(embedding)
+    cache, lock = _get_sem_cache()
+    with lock:
+        if not cache:
+            return None
+        matrix = np.stack([entry[0] for entry in cache])
+        # int16 operands keep the dot product memory-bandwidth bound; the
+        # int32 accumulator avoids overflow at 1536 dimensions
+        similarities = np.einsum("ij,j->i",
+                                 matrix.astype(np.int16),
+                                 query.astype(np.int16),
+                                 dtype=np.int32)
+        best = int(np.argmax(similarities))
+        if similarities[best] >= _SEM_CACHE_THRESHOLD_Q:
+            # Move the hit to the MRU end before returning it
+            entry = cache[best]
+            del cache[best]
+            cache.append(entry)
+            return entry[1]
+        return None
+
+def _sem_cache_store(embedding: np.ndarray, suggestions: List[Dict[str, str]]):
+    """Store a validated suggestion list; the deque evicts the LRU entry when full."""
+    cache, lock = _get_sem_cache()
+    with lock:
+        cache.append((_quantize_embedding(embedding), suggestions))
+
+# Candidate-name embeddings reused across trademark checks, keyed by lowercased
+# name; built behind cache_resource so repeats actually hit across reruns
+@st.cache_resource
+def _get_name_embedding_cache():
+    """Construct the shared name-embedding cache and its lock once per process"""
+    return {}, threading.Lock()
+
+def _embed_names(names: List[str]) -> Dict[str, List[float]]:
+    """Embed names for trademark similarity search, batching all cache misses
+    into a single OpenAI call. Returns embeddings keyed by lowercased name."""
+    cache, lock = _get_name_embedding_cache()
+    with lock:
+        missing = [name for name in names if name.lower() not in cache]
+
+    if missing:
+        response = client.embeddings.create(
+            model="text-embedding-3-small",
+            input=missing
+        )
+        with lock:
+            for name, item in zip(missing, response.data):
+                cache[name.lower()] = item.embedding
+
+    with lock:
+        return {name.lower(): cache[name.lower()] for name in names}
+
+@st.cache_resource
+def get_indexes():
+    """Construct the Pinecone index handles once and share them across reruns"""
     def connect_to_index(index_name):
         try:
             return pc.Index(index_name)
         except Exception:
             return None
-    
-    # Create threads for connecting to each index
-    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-        primary_future = executor.submit(connect_to_index, primary_index_name)
-        trademark_future = executor.submit(connect_to_index, trademark_index_name)
-        
-        # Get the results
-        global primary_index, trademark_index
-        primary_index = primary_future.result()
-        trademark_index = trademark_future.result()
+
+    return (connect_to_index(primary_index_name),
+            connect_to_index(trademark_index_name))
+
+# pc.Index() is a cheap local constructor, so build the handles at import
+# instead of verifying them from a background thread on every rerun
+primary_index, trademark_index = get_indexes()
+
+def _warm_connections():
+    """Prime the OpenAI and Pinecone connection pools so the first click
+    doesn't pay the ~150 ms TLS handshake on either service"""
+    try:
+        client.models.list()
+    except Exception:
+        pass
+
+    try:
+        if primary_index:
+            primary_index.describe_index_stats()
+    except Exception:
+        pass
+
+# Warm the pools off the critical path while the page renders; cache_resource
+# gates the thread to one per process instead of one per rerun
+@st.cache_resource
+def _start_connection_warming() -> threading.Thread:
+    """Kick off the one-time connection warming thread"""
+    thread = threading.Thread(target=_warm_connections, daemon=True)
+    thread.start()
+    return thread
+
+_start_connection_warming()
+
+# Cosine similarity above which an ANN match counts as a potential collision
+_TRADEMARK_SIMILARITY_THRESHOLD = 0.85
+
+def _matches_collide(main_name: str, matches) -> bool:
+    """Check whether any sufficiently similar match shares the candidate's main part"""
+    # Lowercase the candidate once instead of on every comparison
+    main_lower = main_name.lower()
+
+    for match in matches:
+        if match.score < _TRADEMARK_SIMILARITY_THRESHOLD:
+            continue
+
+        if 'wordMark' in match.metadata:
+            trademark = match.metadata['wordMark']
+
+            # Extract the main part of the trademark before any dash
+            if ' - ' in trademark:
+                trademark_main = trademark.split(' - ')[0].strip()
+            else:
+                trademark_main = trademark
+
+            # Check if the main parts of the names are the same or very similar
+            tm_lower = trademark_main.lower()
+            if main_lower in tm_lower or tm_lower in main_lower:
+                return True
+
+    return False
+
+# Resolved existence verdicts shared across reruns, keyed by the exact
+# stripped name (the original_data filter is case-sensitive). batch_exists
+# consults this before querying, so candidates repeated across
+# regenerations skip their Pinecone round-trips.
+@st.cache_resource
+def _get_name_check_cache():
+    """Construct the shared per-name verdict cache and its lock once per process"""
+    return {}, threading.Lock()
 
 class NameValidator:
     @staticmethod
-    def name_exists_in_database(name: str) -> bool:
+    def batch_exists(names: List[str]) -> set:
         """
-        Check if a business name already exists in the Pinecone database.
-        
+        Check a whole batch of candidate names in one query per index.
+
         Args:
-            name: The business name to check
-            
+            names: The business names to check
+
         Returns:
-            bool: True if the name exists, False otherwise
+            set: The subset of names that already exist in either index
         """
-        # Create threads to check both indexes simultaneously
-        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-            primary_future = executor.submit(NameValidator._check_primary_index, name)
-            trademark_future = executor.submit(NameValidator._check_trademark_index, name)
-            
-            # If either check returns True, the name exists
-            return primary_future.result() or trademark_future.result()
-        
+        if not names:
+            return set()
+
+        cache, lock = _get_name_check_cache()
+
+        # Resolve candidates seen in earlier generations from the shared
+        # cache; only the misses pay the Pinecone round-trips
+        with lock:
+            existing = {name for name in names if cache.get(name.strip())}
+            misses = [name for name in names if name.strip() not in cache]
+
+        if misses:
+            # One round-trip per index instead of two per name. The primary
+            # batch query runs on the pool, but the trademark batch is driven
+            # from this thread: it submits its own per-name queries to the
+            # same bounded pool, and running it as a pool task would let
+            # enough concurrent generations fill every worker with outer
+            # tasks blocking on inner ones — a deadlock.
+            primary_future = _EXECUTOR.submit(NameValidator._batch_check_primary_index, misses)
+            found = NameValidator._batch_check_trademark_index(misses)
+            found |= primary_future.result()
+
+            with lock:
+                for name in misses:
+                    cache[name.strip()] = name in found
+
+            existing |= found
+
+        return existing
+
     @staticmethod
-    def _check_primary_index(name: str) -> bool:
-        """Check if name exists in the primary index"""
+    def _batch_check_primary_index(names: List[str]) -> set:
+        """Return the names from the batch that exist in the primary index"""
         global primary_index
-        
+
         if not primary_index:
-            return False  # Assume name doesn't exist if we can't check
-            
+            return set()  # Assume names don't exist if we can't check
+
         try:
-            with pinecone_lock:  # Use a lock to ensure thread-safe Pinecone operations
-                # Query the index for exact match on original_data field
-                results = primary_index.query(
-                    vector=[0] * 1536,  # Dummy vector, we're only checking metadata
-                    top_k=1,
-                    include_metadata=True,
-                    filter={
-                        "original_data": {"$eq": name}
-                    }
-                )
-                
-                # Return True if any matching records found
-                exists = len(results.matches) > 0
-                return exists
-            
+            # Single query matching any of the candidate names
+            results = primary_index.query(
+                vector=_ZERO_VEC,  # Dummy vector, we're only checking metadata
+                top_k=len(names),
+                include_metadata=True,
+                filter={
+                    "original_data": {"$in": names}
+                }
+            )
+
+            return {
+                match.metadata["original_data"]
+                for match in results.matches
+                if "original_data" in match.metadata
+            }
+
         except Exception:
             # Silently handle the error
-            return False
-            
+            return set()
+
     @staticmethod
-    def _check_trademark_index(name: str) -> bool:
-        """Check if name exists in the trademark index"""
+    def _batch_check_trademark_index(names: List[str]) -> set:
+        """Return the names from the batch whose main part collides with a trademark"""
         global trademark_index
-        
+
         if not trademark_index:
-            return False  # Assume name doesn't exist if we can't check
-            
+            return set()  # Assume names don't exist if we can't check
+
         try:
-            with pinecone_lock:  # Use a lock to ensure thread-safe Pinecone operations
-                # Extract the main business name part before any dash or special character
-                # This handles cases like "BusinessName - Tagline"
-                main_name = name.split('-')[0].strip()
-                
-                # Query the trademark index looking for wordMark field
-                results = trademark_index.query(
-                    vector=[0] * 1536,  # Dummy vector, we're only checking metadata
-                    top_k=10,  # Check a few potential matches
+            # Map each candidate's main part (before any dash) back to the full name
+            main_names = {}
+            for name in names:
+                main_names.setdefault(name.split('-')[0].strip(), []).append(name)
+
+            # One embedding call covers every candidate main part
+            embeddings = _embed_names(list(main_names))
+
+            # The index handle is thread-safe, so the queries below genuinely
+            # run in parallel on the worker pool
+            def query_similar(main_name):
+                return trademark_index.query(
+                    vector=embeddings[main_name.lower()],
+                    top_k=5,
                     include_metadata=True
                 )
-                
-                # Check if any of the returned wordMarks contain our name or vice versa
-                for match in results.matches:
-                    if 'wordMark' in match.metadata:
-                        trademark = match.metadata['wordMark']
-                        
-                        # Extract the main part of the trademark before any dash
-                        if ' - ' in trademark:
-                            trademark_main = trademark.split(' - ')[0].strip()
-                        else:
-                            trademark_main = trademark
-                        
-                        # Check if the main parts of the names are the same or very similar
-                        if (main_name.lower() in trademark_main.lower() or 
-                            trademark_main.lower() in main_name.lower()):
-                            return True
-                
-                return False
-            
+
+            # Run the per-candidate similarity searches on the shared worker pool
+            futures = {
+                main_name: _EXECUTOR.submit(query_similar, main_name)
+                for main_name in main_names
+            }
+
+            existing = set()
+            for main_name, future in futures.items():
+                if _matches_collide(main_name, future.result().matches):
+                    existing.update(main_names[main_name])
+
+            return existing
+
         except Exception:
             # Silently handle the error
-            return False
+            return set()
 
-class BusinessNameGenerator:
-    @staticmethod
-    def generate_business_names(description: str) -> List[Dict[str, str]]:
-        """Generate unique business name suggestions based on user description."""
-        try:
-            # Updated to use OpenAI v1.0+ API
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """You are an expert brand naming consultant specializing in creating COMPLETELY UNIQUE business names. Your goal is to:
+# Number of candidate names requested from the model per generation
+_NUM_CANDIDATES = 12
+
+# Frozen system prompts: keeping the bytes identical across requests lets
+# OpenAI's server-side prompt caching kick in for the static prefix
+_SYSTEM_PROMPT_FULL = """You are an expert brand naming consultant specializing in creating COMPLETELY UNIQUE business names. Your goal is to:
                         - Generate names that are 100% distinct from each other
                         - Capture the unique essence of the business
                         - Ensure no two names sound or look similar
@@ -165,84 +387,154 @@ class BusinessNameGenerator:
                         - ABSOLUTELY NO DUPLICATE OR SIMILAR NAMES
                         - Each name must be completely unique in sound, structure, and meaning
                         - Prioritize creativity and distinctiveness
-                        - Format your response as a JSON array of objects with "name" and "description" properties
+                        - Format your response as a JSON object with a "names" array of objects with "name" and "description" properties
                         - Each description must be approximately 10 words and explain why the name fits the business"""
+
+# Compact variant for trivial descriptions: a one-word idea gains nothing
+# from the verbose bullet list, so skip ~60% of the prompt tokens
+_SYSTEM_PROMPT_SHORT = """You are an expert brand naming consultant. Generate completely unique, memorable, trademark-friendly business names with zero similarity between them. Respond as a JSON object with a "names" array of objects with "name" and "description" properties, each description ~10 words on why the name fits."""
+
+# Descriptions shorter than this use the compact system prompt
+_SHORT_DESCRIPTION_CUTOFF = 40
+
+# tiktoken lets us right-size max_tokens instead of using a blind ceiling
+try:
+    _ENCODER = tiktoken.encoding_for_model("gpt-4o-mini")
+except Exception:
+    _ENCODER = tiktoken.get_encoding("cl100k_base")
+
+def _completion_budget(description: str) -> int:
+    """Token budget for one generation: ~35 tokens per candidate (name plus
+    10-word description in JSON) plus scaffolding, with a little headroom for
+    long descriptions whose vocabulary the model tends to echo."""
+    description_tokens = len(_ENCODER.encode(description))
+    return min(500, 35 * _NUM_CANDIDATES + 50 + description_tokens // 4)
+
+class BusinessNameGenerator:
+    @staticmethod
+    def generate_business_names(description: str) -> List[Dict[str, str]]:
+        """Generate unique business name suggestions based on user description."""
+        try:
+            # Check the semantic cache first: a near-duplicate description skips both
+            # the OpenAI completion and the follow-up Pinecone validations
+            description_embedding = None
+            try:
+                description_embedding = _cache_embed(description)
+                cached_suggestions = _sem_cache_lookup(description_embedding)
+                if cached_suggestions is not None:
+                    return cached_suggestions
+            except Exception:
+                # Cache failures fall through to a normal generation
+                pass
+
+            # Updated to use OpenAI v1.0+ API; stream the response so Pinecone
+            # validation can start before the model has finished generating
+            response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                response_format={"type": "json_object"},
+                messages=[
+                    {
+                        "role": "system",
+                        # Short inputs get the compact prompt variant
+                        "content": (_SYSTEM_PROMPT_SHORT
+                                    if len(description) < _SHORT_DESCRIPTION_CUTOFF
+                                    else _SYSTEM_PROMPT_FULL)
                     },
                     {
                         "role": "user",
-                        "content": f"Create 12 COMPLETELY UNIQUE business names for this description, ensuring ZERO similarity between names: '{description}'. For each name, provide a 10-word description of why it's appropriate."
+                        "content": f"Create {_NUM_CANDIDATES} COMPLETELY UNIQUE business names for this description, ensuring ZERO similarity between names: '{description}'. For each name, provide a 10-word description of why it's appropriate."
                     }
                 ],
-                max_tokens=500,
+                max_tokens=_completion_budget(description),
                 n=1,
-                temperature=0.8
+                temperature=0.8,
+                stream=True
             )
-            suggestions_text = response.choices[0].message.content.strip()
-            
-            # Parse the JSON string into a list of dictionaries
-            try:
-                suggestions = json.loads(suggestions_text)
-            except json.JSONDecodeError:
-                # Fallback: Extract name-description pairs using regex if JSON parsing fails
-                name_pattern = r'(?:"name":|^\d+\.)\s*"([^"]+)"'
-                desc_pattern = r'(?:"description":|explanation:)\s*"([^"]+)"'
-                
-                names = re.findall(name_pattern, suggestions_text, re.MULTILINE)
-                descriptions = re.findall(desc_pattern, suggestions_text, re.MULTILINE)
-                
-                suggestions = []
-                for i in range(min(len(names), len(descriptions))):
-                    suggestions.append({
-                        "name": names[i],
-                        "description": descriptions[i]
-                    })
-            
-            # Filter and validate names against database using parallel processing
-            unique_suggestions = []
-            
-            def validate_name(suggestion):
-                name = suggestion["name"]
-                # Check if name exists in database
-                if not NameValidator.name_exists_in_database(name):
-                    return suggestion
-                return None
-            
-            # Use ThreadPoolExecutor to validate names in parallel
-            with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-                validation_results = list(executor.map(validate_name, suggestions))
-            
-            # Filter out None results (failed validation)
-            unique_suggestions = [result for result in validation_results if result is not None]
+
+            suggestions = []
+            seen_names = set()
+            suggestions_text = ""
+
+            # Incremental parse: track brace depth across streamed chunks and
+            # cut out each JSON object as soon as its closing brace arrives
+            depth = 0
+            in_string = False
+            escaped = False
+            object_start = -1
+
+            for chunk in response:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                offset = len(suggestions_text)
+                suggestions_text += delta
+
+                for i in range(offset, len(suggestions_text)):
+                    char = suggestions_text[i]
+                    if escaped:
+                        escaped = False
+                        continue
+                    if char == '\\':
+                        escaped = True
+                        continue
+                    if char == '"':
+                        in_string = not in_string
+                        continue
+                    if in_string:
+                        continue
+                    if char == '{':
+                        depth += 1
+                        # Suggestion objects sit inside the {"names": [...]} wrapper
+                        if depth == 2:
+                            object_start = i
+                    elif char == '}':
+                        depth -= 1
+                        if depth == 1 and object_start >= 0:
+                            try:
+                                # orjson parses straight from bytes, several times
+                                # faster than stdlib json on unicode-heavy output
+                                suggestion = orjson.loads(suggestions_text[object_start:i + 1].encode())
+                            except orjson.JSONDecodeError:
+                                suggestion = None
+                            if (isinstance(suggestion, dict) and
+                                    "name" in suggestion and "description" in suggestion):
+                                # Skip duplicates via an O(1) set lookup
+                                name_key = suggestion["name"].strip().lower()
+                                if name_key not in seen_names:
+                                    seen_names.add(name_key)
+                                    suggestions.append(suggestion)
+                            object_start = -1
+
+            # Validate the whole batch with one query per index instead of
+            # two round-trips per candidate
+            existing_names = NameValidator.batch_exists(
+                [suggestion["name"] for suggestion in suggestions]
+            )
+            unique_suggestions = [
+                suggestion for suggestion in suggestions
+                if suggestion["name"] not in existing_names
+            ]
             
             # If we don't have enough valid names, show a warning
             if len(unique_suggestions) < 6:
                 st.warning(f"Some generated names already exist in the database. Showing {len(unique_suggestions)} unique options.")
-            
-            return unique_suggestions[:12]  # Limit to 6 suggestions
+
+            unique_suggestions = unique_suggestions[:12]
+
+            # Store the validated results so similar future descriptions hit the cache
+            if description_embedding is not None and unique_suggestions:
+                _sem_cache_store(description_embedding, unique_suggestions)
+
+            return unique_suggestions
             
         except Exception as e:
             st.error(f"Error generating business names: {str(e)}")
             return []
 
-def main():
-    # Page configuration
-    st.set_page_config(
-        page_title="Zolvit Name Generator",
-        page_icon="🚀",
-        layout="wide"
-    )
-    
-    # Initialize session state for generated names
-    if 'generated_names' not in st.session_state:
-        st.session_state.generated_names = []
-    
-    # Start index verification in a background thread when app initializes
-    if 'index_verification_started' not in st.session_state:
-        threading.Thread(target=verify_indexes, daemon=True).start()
-        st.session_state.index_verification_started = True
-    
-    # Custom CSS for professional look
-    st.markdown("""
+@st.cache_data
+def _css() -> str:
+    """Custom CSS for professional look, built once and reused across reruns"""
+    return """
     <style>
     /* Professional dark theme */
     .stApp {
@@ -319,7 +611,22 @@ def main():
         margin: 0 auto;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def main():
+    # Page configuration
+    st.set_page_config(
+        page_title="Zolvit Name Generator",
+        page_icon="🚀",
+        layout="wide"
+    )
+    
+    # Initialize session state for generated names
+    if 'generated_names' not in st.session_state:
+        st.session_state.generated_names = []
+    
+    # Custom CSS for professional look
+    st.markdown(_css(), unsafe_allow_html=True)
     
     # Main container
     st.markdown('<div class="main-container">', unsafe_allow_html=True)
@@ -352,21 +659,10 @@ def main():
             # Show spinner during processing
             with progress_placeholder.container():
                 with st.spinner("Generating unique business names and validating against existing records..."):
-                    # Use a thread to generate names
-                    name_queue = Queue()
-                    
-                    def generate_names_thread():
-                        generated_names = BusinessNameGenerator.generate_business_names(description)
-                        name_queue.put(generated_names)
-                    
-                    # Start name generation in a thread
-                    generation_thread = threading.Thread(target=generate_names_thread)
-                    generation_thread.start()
-                    generation_thread.join()  # Wait for the thread to complete
-                    
-                    # Get results from the queue
-                    generated_names = name_queue.get()
-                    
+                    # Generation is already parallel internally, so calling it
+                    # inline avoids a useless thread start/join round-trip
+                    generated_names = BusinessNameGenerator.generate_business_names(description)
+
                     if generated_names:
                         st.session_state.generated_names = generated_names
                         
@@ -386,18 +682,19 @@ def main():
         st.subheader("Business Names")
         st.markdown("✅ All names verified as unique")
         
-        # Create a grid layout for the names
-        cols = st.columns(3)
-        
-        for i, suggestion in enumerate(st.session_state.generated_names):
-            with cols[i % 3]:
-                st.markdown(f"""
-                <div style='text-align: center; padding: 15px; background-color: #2C3040; border-radius: 8px; margin-bottom: 15px;'>
+        # Render all cards in one markdown call: a CSS grid replaces the
+        # st.columns widgets and their per-cell serializer round-trips
+        cards = ''.join(f"""
+                <div style='text-align: center; padding: 15px; background-color: #2C3040; border-radius: 8px;'>
                     <h3>{suggestion['name']}</h3>
                     <span class='validated-badge'>Verified Unique</span>
                     <p class='name-description'>{suggestion['description']}</p>
                 </div>
-                """, unsafe_allow_html=True)
+                """ for suggestion in st.session_state.generated_names)
+        st.markdown(
+            f"<div style='display: grid; grid-template-columns: repeat(3, 1fr); gap: 15px;'>{cards}</div>",
+            unsafe_allow_html=True
+        )
         
         # Close name container
         st.markdown('</div>', unsafe_allow_html=True)
@@ -1,20 +1,40 @@
 import os
-from typing import List, Dict
-import re
+from typing import List, Dict, Optional
 from dotenv import load_dotenv
 import pinecone
-from pinecone import Pinecone
+try:
+    # The gRPC client multiplexes queries over one long-lived HTTP/2 stream,
+    # dropping the per-call TLS+HTTP overhead of the REST transport
+    from pinecone.grpc import PineconeGRPC as Pinecone
+except ImportError:
+    from pinecone import Pinecone
 import json
-from openai import OpenAI
+import orjson
+import asyncio
+import hashlib
+import threading
+import time
+from cachetools import TTLCache
+from pybloom_live import ScalableBloomFilter
+from openai import AsyncOpenAI
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 import uvicorn
+import httpx
 
 # Load environment variables
 load_dotenv()
 
-# Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Shared HTTP pool for OpenAI traffic: the SDK default pool is modest and
+# serializes requests under concurrent load
+http_client = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    timeout=30.0
+)
+
+# Initialize async OpenAI client so requests multiplex on the event loop
+aclient = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=http_client)
 
 # Initialize Pinecone
 pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
@@ -23,23 +43,191 @@ pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
 primary_index_name = os.getenv("PINECONE_INDEX_NAME", "mca-scraped-final1")
 trademark_index_name = os.getenv("TRADEMARK_INDEX_NAME", "tm-prod-pipeline")
 
-# Initialize indexes
+# Initialize indexes, sized for the gathered per-candidate query fan-out so
+# concurrent requests don't queue behind a single connection
 try:
-    primary_index = pc.Index(primary_index_name)
+    primary_index = pc.Index(primary_index_name, pool_threads=32)
 except Exception as e:
     print(f"Error connecting to primary index: {str(e)}")
     primary_index = None
 
 try:
-    trademark_index = pc.Index(trademark_index_name)
+    trademark_index = pc.Index(trademark_index_name, pool_threads=32)
 except Exception as e:
     print(f"Error connecting to trademark index: {str(e)}")
     trademark_index = None
 
+# Dummy query vector built once; the existence checks are metadata-filtered,
+# so reallocating 1536 floats per call is pure overhead
+_ZERO_VEC = [0.0] * 1536
+
+# Semantic response cache backed by its own Pinecone index: paraphrased
+# descriptions ("a coffee shop in Mumbai" vs "Mumbai coffee shop") reuse the
+# stored suggestion list instead of re-calling the chat model
+cache_index_name = os.getenv("CACHE_INDEX_NAME", "name-gen-cache")
+try:
+    cache_index = pc.Index(cache_index_name, pool_threads=8)
+except Exception as e:
+    print(f"Error connecting to cache index: {str(e)}")
+    cache_index = None
+
+# Cosine similarity above which a cached description counts as a hit
+_SEM_CACHE_THRESHOLD = 0.92
+
+# Suggestion lists go stale as new companies register and marks get filed;
+# hits older than this are evicted and regenerated instead of served,
+# matching the day-long TTL on the per-name existence cache
+_SEM_CACHE_TTL = 86400
+
+# Frozen system prompt: OpenAI's server-side prompt caching keys on a
+# byte-identical prefix, so the static instructions live in one module
+# constant and only the short user description varies per request
+_SYSTEM_PROMPT = """You are an expert brand naming consultant. Generate completely unique, memorable, trademark-friendly business names with zero similarity between them. Respond as a JSON object with a "names" array of objects with "name" and "description" properties; each description is ~10 words on why the name fits the business."""
+
+# Exact-repeat cache: identical descriptions (retries, tests, bot traffic)
+# short-circuit before even the embedding call; entries expire after an hour
+_PROMPT_CACHE = TTLCache(maxsize=10_000, ttl=3600)
+_prompt_cache_lock = threading.Lock()
+
+# Existence results cached for a day: generated names follow a Zipfian
+# distribution, so warm traffic skips a large share of the Pinecone
+# confirmations; the TTL lets new filings eventually propagate
+_NAME_CHECK_CACHE = TTLCache(maxsize=200_000, ttl=86400)
+_name_check_lock = threading.Lock()
+
+class _CircuitBreaker:
+    """Minimal circuit breaker for the Pinecone checks.
+
+    After fail_max consecutive timeouts the breaker opens and calls are
+    skipped outright until reset_timeout elapses, at which point one probe
+    attempt is let through.
+    """
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allows(self) -> bool:
+        """Whether a call may proceed right now"""
+        with self._lock:
+            if self._failures < self.fail_max:
+                return True
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                # Half-open: let a single probe through
+                self._failures = self.fail_max - 1
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+
+_PINECONE_BREAKER = _CircuitBreaker()
+
+# A degraded Pinecone otherwise holds requests for the default HTTP timeout
+_PINECONE_TIMEOUT = 2.0
+
+def _load_known_names_bloom():
+    """Build a Bloom filter over the known company/trademark names.
+
+    A Bloom negative proves the exact full name is absent, so those
+    candidates skip the primary-index lookup; only possible hits are
+    confirmed remotely. The trademark checks are unaffected — they match on
+    the candidate's main part, which a filter of full names cannot rule
+    out. Reads a newline-delimited dump of the source-of-truth names from
+    KNOWN_NAMES_FILE; without one the filter stays disabled and every
+    candidate is checked remotely as before.
+    """
+    known_names_file = os.getenv("KNOWN_NAMES_FILE")
+    if not known_names_file:
+        return None
+
+    try:
+        bloom = ScalableBloomFilter(initial_capacity=10_000_000, error_rate=0.001)
+        with open(known_names_file) as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    bloom.add(line.lower())
+        return bloom
+    except Exception as e:
+        print(f"Error building known-names Bloom filter: {str(e)}")
+        return None
+
+BLOOM = _load_known_names_bloom()
+
+async def _embed_description(description: str) -> List[float]:
+    """Embed a description for semantic cache lookups."""
+    response = await aclient.embeddings.create(
+        model="text-embedding-3-small",
+        input=description
+    )
+    return response.data[0].embedding
+
+async def _embed_names(names: List[str]) -> List[List[float]]:
+    """Embed a whole batch of candidate names in one OpenAI call."""
+    response = await aclient.embeddings.create(
+        model="text-embedding-3-small",
+        input=names
+    )
+    return [item.embedding for item in response.data]
+
+def _sem_cache_lookup(embedding: List[float]):
+    """Return the cached suggestion list for the closest stored description,
+    or None when nothing clears the similarity threshold."""
+    if not cache_index:
+        return None
+
+    try:
+        hits = cache_index.query(vector=embedding, top_k=1, include_metadata=True)
+        if hits.matches and hits.matches[0].score >= _SEM_CACHE_THRESHOLD:
+            match = hits.matches[0]
+            # Entries without a timestamp predate the TTL and count as stale
+            cached_at = float(match.metadata.get("cached_at", 0))
+            if time.time() - cached_at <= _SEM_CACHE_TTL:
+                return orjson.loads(match.metadata["suggestions"])
+            # Evict the stale entry so a freshly validated list replaces it
+            cache_index.delete(ids=[match.id])
+    except Exception as e:
+        print(f"Error querying semantic cache: {str(e)}")
+
+    return None
+
+def _sem_cache_store(description: str, embedding: List[float], suggestions: List[Dict[str, str]]):
+    """Store a validated suggestion list keyed by the description embedding."""
+    if not cache_index:
+        return
+
+    try:
+        cache_index.upsert(vectors=[{
+            "id": hashlib.sha256(description.strip().lower().encode()).hexdigest(),
+            "values": embedding,
+            "metadata": {
+                "suggestions": json.dumps(suggestions),
+                "cached_at": time.time()
+            }
+        }])
+    except Exception as e:
+        print(f"Error storing semantic cache entry: {str(e)}")
+
 # Initialize FastAPI
 app = FastAPI(title="Zolvit Name Generator API", 
               version="1.0.0",
-              description="Generate unique business names based on descriptions")
+              description="Generate unique business names based on descriptions",
+              default_response_class=ORJSONResponse)
+
+@app.on_event("shutdown")
+async def close_http_client():
+    """Close the shared OpenAI HTTP pool cleanly on shutdown"""
+    await http_client.aclose()
 
 # Pydantic models for request/response
 class BusinessDescriptionRequest(BaseModel):
@@ -54,7 +242,7 @@ class NameSuggestionsResponse(BaseModel):
 
 class NameValidator:
     @staticmethod
-    def name_exists_in_database(name: str) -> bool:
+    async def name_exists_in_database(name: str) -> bool:
         """
         Check if a business name already exists in the Pinecone database.
         
@@ -64,29 +252,126 @@ class NameValidator:
         Returns:
             bool: True if the name exists, False otherwise
         """
-        # Check primary index (original format)
-        if NameValidator._check_primary_index(name):
-            return True
-            
-        # Check trademark index (wordMark format)
-        if NameValidator._check_trademark_index(name):
-            return True
-            
-        # Name doesn't exist in either index
-        return False
+        return (await NameValidator.batch_exists([name]))[0]
+
+    @staticmethod
+    async def batch_exists(names: List[str]) -> List[bool]:
+        """
+        Check a batch of names concurrently against both indexes.
+
+        One embedding call covers every candidate's main part; the primary
+        lookups and trademark similarity searches then run gathered.
+
+        Args:
+            names: The business names to check
+
+        Returns:
+            list: One existence flag per name, in input order
+        """
+        flags = {name: False for name in names}
+        confirmed = []
+
+        # Resolve warm names from the TTL cache before any remote work.
+        # Keys keep their case: the primary original_data filter is
+        # case-sensitive, so "ACME" and "acme" must not share one flag.
+        unresolved = []
+        with _name_check_lock:
+            for name in names:
+                key = name.strip()
+                if key in _NAME_CHECK_CACHE:
+                    flags[name] = _NAME_CHECK_CACHE[key]
+                else:
+                    unresolved.append(name)
+
+        if unresolved:
+            main_names = [name.split('-')[0].strip() for name in unresolved]
+
+            # The Bloom filter holds full names, the same key space as the
+            # primary index's original_data, so a negative lets a candidate
+            # skip that lookup. The trademark checks match on the candidate's
+            # *main part*, which a full-name filter can't rule out, so both
+            # the exact wordMark filter and the similarity search always run.
+            if BLOOM is not None:
+                primary_names = [name for name in unresolved
+                                 if name.strip().lower() in BLOOM]
+            else:
+                primary_names = list(unresolved)
+
+            try:
+                embeddings = await _embed_names(main_names)
+            except Exception as e:
+                print(f"Error embedding candidate names: {str(e)}")
+                embeddings = [None] * len(unresolved)
+
+            primary_results, trademark_results = await asyncio.gather(
+                asyncio.gather(
+                    *[NameValidator._guarded_check(NameValidator._check_primary_index, name)
+                      for name in primary_names]
+                ),
+                asyncio.gather(
+                    *[NameValidator._guarded_check(NameValidator._check_trademark_similarity,
+                                                   main_name, embedding)
+                      for main_name, embedding in zip(main_names, embeddings)]
+                )
+            )
+            primary_flags = dict(zip(primary_names, primary_results))
+
+            # A name exists if either index matched. Only verdicts whose
+            # checks actually ran get cached: an open breaker, a timeout or
+            # a failed embedding yields None, and caching that degraded
+            # False would serve a false "verified unique" for the full TTL.
+            # A positive from either index is authoritative on its own; a
+            # Bloom-gated skip counts as a genuine absent.
+            for i, name in enumerate(unresolved):
+                primary = primary_flags.get(name, False)
+                trademark = trademark_results[i]
+                flags[name] = primary is True or trademark is True
+                if flags[name] or (primary is not None and trademark is not None):
+                    confirmed.append(name)
+
+        # Remember every fully verified result for the TTL window
+        with _name_check_lock:
+            for name in confirmed:
+                _NAME_CHECK_CACHE[name.strip()] = flags[name]
+
+        return [flags[name] for name in names]
         
     @staticmethod
-    def _check_primary_index(name: str) -> bool:
-        """Check if name exists in the primary index"""
+    async def _guarded_check(check, *args) -> Optional[bool]:
+        """Run a blocking index check with a short timeout behind the breaker.
+
+        Returns None when the check never actually ran — breaker open or
+        timed out — so callers can tell "verified absent" from "unverified"
+        and keep degraded results out of the TTL cache.
+        """
+        if not _PINECONE_BREAKER.allows():
+            return None
+
+        try:
+            result = await asyncio.wait_for(
+                asyncio.to_thread(check, *args),
+                timeout=_PINECONE_TIMEOUT
+            )
+            _PINECONE_BREAKER.record_success()
+            return result
+        except asyncio.TimeoutError:
+            print("Pinecone check timed out; circuit breaker recorded a failure")
+            _PINECONE_BREAKER.record_failure()
+            return None
+
+    @staticmethod
+    def _check_primary_index(name: str) -> Optional[bool]:
+        """Check if name exists in the primary index; None when the check
+        couldn't run"""
         global primary_index
-        
+
         if not primary_index:
-            return False  # Assume name doesn't exist if we can't check
-            
+            return None  # Can't check: unknown, not verified absent
+
         try:
             # Query the index for exact match on original_data field
             results = primary_index.query(
-                vector=[0] * 1536,  # Dummy vector, we're only checking metadata
+                vector=_ZERO_VEC,  # Dummy vector, we're only checking metadata
                 top_k=1,
                 include_metadata=True,
                 filter={
@@ -97,127 +382,194 @@ class NameValidator:
             # Return True if any matching records found
             exists = len(results.matches) > 0
             return exists
-            
+
         except Exception as e:
             print(f"Error checking name in primary database: {str(e)}")
-            return False
+            return None
             
+    # Cosine similarity above which a trademark ANN match counts as a collision
+    TRADEMARK_SIMILARITY_THRESHOLD = 0.85
+
     @staticmethod
-    def _check_trademark_index(name: str) -> bool:
-        """Check if name exists in the trademark index"""
+    def _check_trademark_similarity(main_name: str, embedding) -> Optional[bool]:
+        """Check if the candidate's main part is semantically close to a trademark.
+
+        Returns None when the check couldn't complete."""
         global trademark_index
-        
+
         if not trademark_index:
-            return False  # Assume name doesn't exist if we can't check
-            
+            return None  # Can't check: unknown, not verified absent
+
         try:
-            # Extract the main business name part before any dash or special character
-            main_name = name.split('-')[0].strip()
-            
-            # Query the trademark index looking for wordMark field
+            # Exact collision first: the ingest pipeline stores the pre-split,
+            # lowercased main token as wordMark_main_lower, so a server-side
+            # equality filter replaces the old Python-side splitting and
+            # case-insensitive comparison with one indexed lookup
             results = trademark_index.query(
-                vector=[0] * 1536,  # Dummy vector, we're only checking metadata
-                top_k=10,  # Check a few potential matches
-                include_metadata=True
+                vector=_ZERO_VEC,  # Dummy vector, we're only checking metadata
+                top_k=1,
+                include_metadata=False,
+                filter={
+                    "wordMark_main_lower": {"$eq": main_name.lower()}
+                }
             )
-            
-            # Check if any of the returned wordMarks contain our name or vice versa
-            for match in results.matches:
-                if 'wordMark' in match.metadata:
-                    trademark = match.metadata['wordMark']
-                    
-                    # Extract the main part of the trademark before any dash
-                    if ' - ' in trademark:
-                        trademark_main = trademark.split(' - ')[0].strip()
-                    else:
-                        trademark_main = trademark
-                    
-                    # Check if the main parts of the names are the same or very similar
-                    if (main_name.lower() in trademark_main.lower() or 
-                        trademark_main.lower() in main_name.lower()):
-                        return True
-            
-            return False
-            
+            if len(results.matches) > 0:
+                return True
+
+            if embedding is not None:
+                # Similarity search with the candidate's real embedding
+                # catches near-identical marks an exact lookup would miss
+                results = trademark_index.query(
+                    vector=embedding,
+                    top_k=5,
+                    include_metadata=False
+                )
+                return any(
+                    match.score >= NameValidator.TRADEMARK_SIMILARITY_THRESHOLD
+                    for match in results.matches
+                )
+
+            # Without an embedding the similarity search never ran, so the
+            # verdict is unknown rather than a clean miss
+            return None
+
         except Exception as e:
             print(f"Error checking name in trademark database: {str(e)}")
-            return False
+            return None
 
 class BusinessNameGenerator:
     @staticmethod
-    def generate_business_names(description: str) -> List[Dict[str, str]]:
+    async def generate_business_names(description: str) -> List[Dict[str, str]]:
         """Generate unique business name suggestions based on user description."""
         try:
-            # Updated to use OpenAI v1.0+ API
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
+            # Exact-repeat cache first: identical descriptions cost nothing
+            prompt_key = hashlib.sha256(description.strip().lower().encode()).hexdigest()
+            with _prompt_cache_lock:
+                if prompt_key in _PROMPT_CACHE:
+                    return _PROMPT_CACHE[prompt_key]
+
+            # Semantic cache next: a near-duplicate description returns in one
+            # embedding call + ANN lookup instead of a multi-second completion
+            embedding = None
+            try:
+                embedding = await _embed_description(description)
+                cached = await asyncio.to_thread(_sem_cache_lookup, embedding)
+                if cached is not None:
+                    return cached
+            except Exception as e:
+                print(f"Semantic cache lookup failed: {str(e)}")
+
+            # JSON mode guarantees a well-formed response, so the prompt only
+            # carries the structural constraints and the regex fallback is gone.
+            # Streaming lets validation start while the model is still
+            # generating the remaining candidates.
+            stream = await aclient.chat.completions.create(
+                model="gpt-4o-mini",
+                response_format={"type": "json_object"},
                 messages=[
                     {
                         "role": "system",
-                        "content": """You are an expert brand naming consultant specializing in creating COMPLETELY UNIQUE business names. Your goal is to:
-                        - Generate names that are 100% distinct from each other
-                        - Capture the unique essence of the business
-                        - Ensure no two names sound or look similar
-                        - Create memorable, trademark-friendly names
-                        - Provide a brief explanation of why each name is being suggested, focusing on how it relates to the business description
-                        
-                        CRITICAL INSTRUCTIONS:
-                        - ABSOLUTELY NO DUPLICATE OR SIMILAR NAMES
-                        - Each name must be completely unique in sound, structure, and meaning
-                        - Prioritize creativity and distinctiveness
-                        - Format your response as a JSON array of objects with "name" and "description" properties
-                        - Each description must be approximately 10 words and explain why the name fits the business"""
+                        "content": _SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
-                        "content": f"Create 12 COMPLETELY UNIQUE business names for this description, ensuring ZERO similarity between names: '{description}'. For each name, provide a 10-word description of why it's appropriate."
+                        # Over-generate so that after dedupe and database
+                        # filtering the response still fills all 12 slots,
+                        # instead of the client re-calling on a shortage
+                        "content": f"Create 20 COMPLETELY UNIQUE business names for this description, ensuring ZERO similarity between names: '{description}'."
                     }
                 ],
-                max_tokens=500,
+                max_tokens=900,
                 n=1,
-                temperature=0.8
+                temperature=0.8,
+                stream=True
             )
-            suggestions_text = response.choices[0].message.content.strip()
-            
-            # Parse the JSON string into a list of dictionaries
-            try:
-                suggestions = json.loads(suggestions_text)
-            except json.JSONDecodeError:
-                # Fallback: Extract name-description pairs using regex if JSON parsing fails
-                name_pattern = r'(?:"name":|^\d+\.)\s*"([^"]+)"'
-                desc_pattern = r'(?:"description":|explanation:)\s*"([^"]+)"'
-                
-                names = re.findall(name_pattern, suggestions_text, re.MULTILINE)
-                descriptions = re.findall(desc_pattern, suggestions_text, re.MULTILINE)
-                
-                suggestions = []
-                for i in range(min(len(names), len(descriptions))):
-                    suggestions.append({
-                        "name": names[i],
-                        "description": descriptions[i]
-                    })
-            
-            # Filter and validate names against database
-            unique_suggestions = []
-            for suggestion in suggestions:
-                name = suggestion["name"]
-                # Skip duplicates
-                if name in [s["name"] for s in unique_suggestions]:
+
+            candidates = []
+            seen = set()
+            validation_tasks = []
+            suggestions_text = ""
+
+            # Incremental parse: track brace depth across streamed chunks and
+            # kick off each candidate's validation the moment its closing
+            # brace arrives, overlapping Pinecone RTTs with token generation
+            depth = 0
+            in_string = False
+            escaped = False
+            object_start = -1
+
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
                     continue
-                    
-                # Check if name exists in database
-                if not NameValidator.name_exists_in_database(name):
+                offset = len(suggestions_text)
+                suggestions_text += delta
+
+                for i in range(offset, len(suggestions_text)):
+                    char = suggestions_text[i]
+                    if escaped:
+                        escaped = False
+                        continue
+                    if char == '\\':
+                        escaped = True
+                        continue
+                    if char == '"':
+                        in_string = not in_string
+                        continue
+                    if in_string:
+                        continue
+                    if char == '{':
+                        depth += 1
+                        # Suggestion objects sit inside the {"names": [...]} wrapper
+                        if depth == 2:
+                            object_start = i
+                    elif char == '}':
+                        depth -= 1
+                        if depth == 1 and object_start >= 0:
+                            try:
+                                # orjson's C parser works straight from bytes
+                                suggestion = orjson.loads(suggestions_text[object_start:i + 1].encode())
+                            except orjson.JSONDecodeError:
+                                suggestion = None
+                            if (isinstance(suggestion, dict) and
+                                    "name" in suggestion and "description" in suggestion):
+                                # Dedupe on the normalized name before spending
+                                # round-trips on repeats
+                                name_key = suggestion["name"].strip().lower()
+                                if name_key not in seen:
+                                    seen.add(name_key)
+                                    candidates.append(suggestion)
+                                    validation_tasks.append(asyncio.create_task(
+                                        NameValidator.name_exists_in_database(suggestion["name"])
+                                    ))
+                            object_start = -1
+
+            # Generation and validation overlapped; collect whatever is left
+            exists_flags = await asyncio.gather(*validation_tasks)
+
+            unique_suggestions = []
+            for suggestion, exists in zip(candidates, exists_flags):
+                if not exists:
                     unique_suggestions.append(suggestion)
                     if len(unique_suggestions) == 12:
                         break
-            
+
+            # Store the validated list so repeats and paraphrases hit the caches
+            if unique_suggestions:
+                with _prompt_cache_lock:
+                    _PROMPT_CACHE[prompt_key] = unique_suggestions
+            if embedding is not None and unique_suggestions:
+                await asyncio.to_thread(
+                    _sem_cache_store, description, embedding, unique_suggestions
+                )
+
             return unique_suggestions
         except Exception as e:
             print(f"Error generating business names: {str(e)}")
             return []
 
 @app.get("/")
-def read_root():
+async def read_root():
     """Root endpoint with API information"""
     return {
         "api": "Zolvit Business Name Generator API",
@@ -226,13 +578,13 @@ def read_root():
     }
 
 @app.post("/generate-names", response_model=NameSuggestionsResponse)
-def generate_names(request: BusinessDescriptionRequest):
+async def generate_names(request: BusinessDescriptionRequest):
     """Generate unique business names based on the provided description"""
     if not request.description:
         raise HTTPException(status_code=400, detail="Business description is required")
     
     # Generate name suggestions
-    suggestions = BusinessNameGenerator.generate_business_names(request.description)
+    suggestions = await BusinessNameGenerator.generate_business_names(request.description)
     
     if not suggestions:
         raise HTTPException(
@@ -243,10 +595,15 @@ def generate_names(request: BusinessDescriptionRequest):
     return {"suggestions": suggestions}
 
 @app.get("/health")
-def health_check():
+async def health_check():
     """Health check endpoint to verify the API is running"""
     return {"status": "ok"}
 
 if __name__ == "__main__":
-    # Run the FastAPI app with uvicorn 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Run the FastAPI app with uvicorn on uvloop + httptools, which cut
+    # event-loop and HTTP-parsing overhead versus the stock asyncio stack.
+    # One worker per core sidesteps the GIL for JSON/Pydantic work; each
+    # worker re-imports this module and so builds its own client pools.
+    uvicorn.run("app_API:app", host="0.0.0.0", port=8000,
+                workers=os.cpu_count(),
+                loop="uvloop", http="httptools")